@@ -56,7 +56,7 @@ artemis_svl.bin (the bootloader binary)
 #       2. Convert the OTA blob into a wired update blob
 #       3. Push the wired update blob into the Artemis module
 
-from typing import Iterator, Tuple
+from typing import List, Tuple
 from PyQt5.QtCore import QSettings, QProcess, QTimer
 from PyQt5.QtWidgets import QWidget, QLabel, QComboBox, QGridLayout, \
     QPushButton, QApplication, QLineEdit, QFileDialog, QPlainTextEdit, \
@@ -79,15 +79,15 @@ BOOTLOADER_VERSION = 5 # << Change this to match the version of artemis_svl.bin
 # Setting constants
 SETTING_PORT_NAME = 'port_name'
 SETTING_FILE_LOCATION = 'message'
-SETTING_BAUD_RATE = '115200' # Default to 115200 for upload
-SETTING_ARTEMIS = 'True' # Default to Artemis-based boards
+SETTING_BAUD_RATE = 'baud_rate'
+SETTING_ARTEMIS = 'artemis'
 
 guiVersion = 'v2.0'
 
-def gen_serial_ports() -> Iterator[Tuple[str, str, str]]:
+def gen_serial_ports() -> List[Tuple[str, str, str]]:
     """Return all available serial ports."""
     ports = QSerialPortInfo.availablePorts()
-    return ((p.description(), p.portName(), p.systemLocation()) for p in ports)
+    return [(p.description(), p.portName(), p.systemLocation()) for p in ports]
 
 #https://stackoverflow.com/a/50914550
 def resource_path(relative_path):
@@ -105,6 +105,10 @@ class MainWindow(QMainWindow):
 
         self.installed_bootloader = -1 # Use this to record the bootloader version
 
+        self._progress = 0 # Number of progress bar characters currently shown
+
+        self._last_repaint = 0.0 # When we last forced a repaint of the messages window
+
         # ///// START of code taken from artemis_svl.py
         
         # Really these should not be self.'globals'. It might be best to put them back into a separate file?
@@ -117,7 +121,7 @@ class MainWindow(QMainWindow):
         self.SVL_CMD_RETRY   = 0x05  # request re-send frame
         self.SVL_CMD_DONE    = 0x06  # finished - all data sent
 
-        self.barWidthInCharacters = 50  # Width of progress bar, ie [###### % complete (NOT USED)
+        self.barWidthInCharacters = 50  # Width of progress bar, ie [###### % complete
 
         self.crcTable = (
             0x0000, 0x8005, 0x800F, 0x000A, 0x801B, 0x001E, 0x0014, 0x8011,
@@ -304,7 +308,7 @@ class MainWindow(QMainWindow):
         # ///// END of code taken from ambiq_bin2board.py
 
         # File location line edit
-        msg_label = QLabel(self.tr('Firmware File:'))
+        msg_label = QLabel('Firmware File:')
         self.fileLocation_lineedit = QLineEdit()
         msg_label.setBuddy(self.fileLocation_lineedit)
         self.fileLocation_lineedit.setEnabled(False)
@@ -312,22 +316,22 @@ class MainWindow(QMainWindow):
             self.on_browse_btn_pressed)
 
         # Browse for new file button
-        browse_btn = QPushButton(self.tr('Browse'))
+        browse_btn = QPushButton('Browse')
         browse_btn.setEnabled(True)
         browse_btn.pressed.connect(self.on_browse_btn_pressed)
 
         # Port Combobox
-        port_label = QLabel(self.tr('COM Port:'))
+        port_label = QLabel('COM Port:')
         self.port_combobox = QComboBox()
         port_label.setBuddy(self.port_combobox)
         self.update_com_ports()
 
         # Refresh Button
-        refresh_btn = QPushButton(self.tr('Refresh'))
+        refresh_btn = QPushButton('Refresh')
         refresh_btn.pressed.connect(self.on_refresh_btn_pressed)
 
         # Baudrate Combobox
-        baud_label = QLabel(self.tr('Baud Rate:'))
+        baud_label = QLabel('Baud Rate:')
         self.baud_combobox = QComboBox()
         baud_label.setBuddy(self.baud_combobox)
         self.update_baud_rates()
@@ -335,16 +339,16 @@ class MainWindow(QMainWindow):
         # Upload Button
         myFont=QFont()
         myFont.setBold(True)
-        upload_btn = QPushButton(self.tr('  Upload Firmware  '))
+        upload_btn = QPushButton('  Upload Firmware  ')
         upload_btn.setFont(myFont)
         upload_btn.pressed.connect(self.on_upload_btn_pressed)
 
         # Upload Button
-        updateBootloader_btn = QPushButton(self.tr(' Update Bootloader '))
+        updateBootloader_btn = QPushButton(' Update Bootloader ')
         updateBootloader_btn.pressed.connect(self.on_update_bootloader_btn_pressed)
 
         # Messages Bar
-        messages_label = QLabel(self.tr('Status / Warnings:'))
+        messages_label = QLabel('Status / Warnings:')
 
         # Messages Window
         self.messages = QPlainTextEdit()
@@ -396,8 +400,12 @@ class MainWindow(QMainWindow):
         widget.setLayout(layout)
         self.setCentralWidget(widget)
 
+        # Single QSettings instance shared by load/save - each construction
+        # opens the registry key / plist so only do it once
+        self._settings = QSettings()
+
         #self._clean_settings() # This will delete all existing settings! Use with caution!
-        
+
         self._load_settings()
 
         # Make the text edit window read-only
@@ -410,11 +418,20 @@ class MainWindow(QMainWindow):
         self.messages.ensureCursorVisible()
         self.messages.appendPlainText(msg)
         self.messages.ensureCursorVisible()
-        self.repaint() # Update/refresh the message window
+
+        # The uploader runs synchronously on the GUI thread so the event
+        # loop cannot deliver paint events while it works. Force a repaint,
+        # but at most ~20 per second so a burst of messages doesn't become
+        # a run of back-to-back full-window redraws. Anything skipped here
+        # is painted as normal once the event loop resumes.
+        now = time.monotonic()
+        if (now - self._last_repaint) >= 0.05:
+            self.repaint() # Update/refresh the message window
+            self._last_repaint = now
 
     def _load_settings(self) -> None:
         """Load settings on startup."""
-        settings = QSettings()
+        settings = self._settings
 
         port_name = settings.value(SETTING_PORT_NAME)
         if port_name is not None:
@@ -426,8 +443,10 @@ class MainWindow(QMainWindow):
         if lastFile is not None:
             self.fileLocation_lineedit.setText(lastFile)
 
-        baud = settings.value(SETTING_BAUD_RATE)
-        if baud is not None:
+        # The combobox userData is int, so read the setting back as int -
+        # QSettings backends return strings and findData would never match
+        baud = settings.value(SETTING_BAUD_RATE, type=int)
+        if baud: # 0 if the setting has never been saved
             index = self.baud_combobox.findData(baud)
             if index > -1:
                 self.baud_combobox.setCurrentIndex(index)
@@ -443,7 +462,7 @@ class MainWindow(QMainWindow):
 
     def _save_settings(self) -> None:
         """Save settings on shutdown."""
-        settings = QSettings()
+        settings = self._settings
         settings.setValue(SETTING_PORT_NAME, self.port)
         settings.setValue(SETTING_FILE_LOCATION, self.fileLocation_lineedit.text())
         settings.setValue(SETTING_BAUD_RATE, self.baudRate)
@@ -455,8 +474,7 @@ class MainWindow(QMainWindow):
 
     def _clean_settings(self) -> None:
         """Clean (remove) all existing settings."""
-        settings = QSettings()
-        settings.clear()
+        self._settings.clear()
 
     def show_error_message(self, msg: str) -> None:
         """Show a Message Box with the error message."""
@@ -465,13 +483,27 @@ class MainWindow(QMainWindow):
     def update_com_ports(self) -> None:
         """Update COM Port list in GUI."""
         previousPort = self.port # Record the previous port before we clear the combobox
-        
+
+        # Suppress per-item signals and repaints while we repopulate -
+        # each addItem would otherwise trigger a model reset and a paint
+        self.port_combobox.setUpdatesEnabled(False)
+        self.port_combobox.blockSignals(True)
+
         self.port_combobox.clear()
 
+        ports = gen_serial_ports()
+
+        # Cache the enumeration - port enumeration is slow (especially on
+        # Windows) so the upload buttons check against this cache rather
+        # than enumerating again. Refresh re-populates it. The buttons only
+        # need to test the selected system location, so build the set here,
+        # once per refresh, instead of once per click.
+        self._ports_cache = {sys for desc, name, sys in ports}
+
         index = 0
         indexOfCH340 = -1
         indexOfPrevious = -1
-        for desc, name, sys in gen_serial_ports():
+        for desc, name, sys in ports:
             longname = desc + " (" + name + ")"
             self.port_combobox.addItem(longname, sys)
             if("CH340" in longname):
@@ -491,14 +523,21 @@ class MainWindow(QMainWindow):
         if indexOfCH340 > -1: # If we found a CH340, let that take priority
             self.port_combobox.setCurrentIndex(indexOfCH340)
 
+        self.port_combobox.blockSignals(False)
+        self.port_combobox.setUpdatesEnabled(True) # Re-enable: one repaint for the whole refresh
+
     def update_baud_rates(self) -> None:
         """Update baud rate list in GUI."""
         # Lowest speed first so code defaults to that
         # if settings.value(SETTING_BAUD_RATE) is None
+        self.baud_combobox.setUpdatesEnabled(False)
+        self.baud_combobox.blockSignals(True)
         self.baud_combobox.clear()
         self.baud_combobox.addItem("115200", 115200)
         self.baud_combobox.addItem("460800", 460800)
         self.baud_combobox.addItem("921600", 921600)
+        self.baud_combobox.blockSignals(False)
+        self.baud_combobox.setUpdatesEnabled(True)
 
     @property
     def port(self) -> str:
@@ -522,53 +561,40 @@ class MainWindow(QMainWindow):
 
     def on_upload_btn_pressed(self) -> None:
         """Check if port is available"""
-        portAvailable = False
-        for desc, name, sys in gen_serial_ports():
-            if (sys == self.port):
-                portAvailable = True
-        if (portAvailable == False):
+        current_port = self.port # One combobox lookup, not one per comparison
+        if current_port not in self._ports_cache:
             self.addMessage("Port No Longer Available")
             return
 
         """Check if file exists"""
-        fileExists = False
-        try:
-            f = open(self.fileLocation_lineedit.text())
-            fileExists = True
-        except IOError:
-            fileExists = False
-        finally:
-            if (fileExists == False):
-                self.addMessage("File Not Found")
-                return
-            f.close()
+        # Fetch the QLineEdit text once - each .text() call crosses the
+        # Qt binding and converts the QString to a Python str.
+        # A single stat() is all we need here - don't open the file just to
+        # check that it exists (phase_bootload does the actual read)
+        fileName = self.fileLocation_lineedit.text()
+        if not os.path.isfile(fileName):
+            self.addMessage("File Not Found: " + fileName)
+            return
 
         self.addMessage("\nUploading firmware")
 
+        self._progress = 0 # Restart the progress bar
         self.upload_main() # Call artemis_svl.py (previously this spawned a QProcess)
 
     def on_update_bootloader_btn_pressed(self) -> None:
         """Check if port is available"""
-        portAvailable = False
-        for desc, name, sys in gen_serial_ports():
-            if (sys == self.port):
-                portAvailable = True
-        if (portAvailable == False):
+        current_port = self.port # One combobox lookup, not one per comparison
+        if current_port not in self._ports_cache:
             self.addMessage("Port No Longer Available")
             return
 
         """Check if file exists"""
-        fileExists = False
-        try:
-            f = open(resource_path(self.appFile))
-            fileExists = True
-        except IOError:
-            fileExists = False
-        finally:
-            if (fileExists == False):
-                self.addMessage("Bootloader file Not Found")
-                return
-            f.close()
+        # As in on_upload_btn_pressed: a stat() is enough, and it avoids the
+        # old try/finally where f.close() raised UnboundLocalError if the
+        # open itself had failed
+        if not os.path.isfile(resource_path(self.appFile)):
+            self.addMessage("Bootloader file Not Found")
+            return
 
         self.addMessage("\nUpdating bootloader")
 
@@ -592,8 +618,9 @@ class MainWindow(QMainWindow):
         """Compute CRC on a byte array"""
 
         #Table and code ported from Artemis SVL bootloader
+        # Iterating bytes/bytearray yields ints directly - no need to copy
+        # the data into a fresh bytearray first
         crc = 0x0000
-        data = bytearray(data)
         for ch in data:
             tableAddr = ch ^ (crc >> 8)
             CRCH = (self.crcTable[tableAddr] >> 8) ^ (crc & 0xFF)
@@ -636,18 +663,17 @@ class MainWindow(QMainWindow):
     def send_packet(self, cmd, data) -> None:
         """Send a packet"""
 
-        data = bytearray(data)
         num_bytes = 3 + len(data)
         #self.addMessage("\tsending packet length " + str(num_bytes))
         payload = bytearray(cmd.to_bytes(1,'big'))
-        payload.extend(data)
+        payload.extend(data) # extend() accepts bytes directly - no intermediate copy
         crc = self.get_crc16(payload)
-        payload.extend(bytearray(crc.to_bytes(2,'big')))
+        payload.extend(crc.to_bytes(2,'big'))
         #self.addMessage("\tsending packet crc " + str(crc))
 
         self.ser.write(num_bytes.to_bytes(2,'big'))
         #self.addMessage("\t" + str(num_bytes.to_bytes(2,'big')))
-        self.ser.write(bytes(payload))
+        self.ser.write(payload) # pyserial accepts a bytearray as-is
         #self.addMessage("\t" + str(bytes(payload)))
 
     def phase_setup(self) -> None:
@@ -699,7 +725,6 @@ class MainWindow(QMainWindow):
 
             total_frames = math.ceil(total_len/frame_size)
             curr_frame = 0
-            progressChars = 0
 
             self.addMessage("\tSending " + str(total_len) +
                          " bytes in " + str(total_frames) + " frames")
@@ -716,7 +741,6 @@ class MainWindow(QMainWindow):
                     bl_done = True
 
                 if( packet['cmd'] == self.SVL_CMD_NEXT ):
-                    self.addMessage("\tGot frame request")
                     curr_frame += 1
                     resend_count = 0
                 elif( packet['cmd'] == self.SVL_CMD_RETRY ):
@@ -732,12 +756,20 @@ class MainWindow(QMainWindow):
 
                 if( curr_frame <= total_frames ):
                     frame_data = application[((curr_frame-1)*frame_size):((curr_frame-1+1)*frame_size)]
-                    self.addMessage("\tSending frame #" + str(curr_frame) + ", length: " + str(len(frame_data)))
+                    # Show the progress in the status bar. Build the bar in
+                    # one go with "#" * n (a single allocation) and repaint
+                    # only the status bar - logging every frame to the
+                    # messages window forces a full window repaint per frame
+                    self._progress = int(curr_frame * self.barWidthInCharacters / total_frames)
+                    self.statusBar().showMessage("Sending frame " + str(curr_frame) + "/" + str(total_frames) + " [" + "#" * self._progress + "]")
+                    self.statusBar().repaint() # The event loop is blocked during the upload so repaint manually
                     self.send_packet(self.SVL_CMD_FRAME, frame_data)
                 else:
                     self.send_packet(self.SVL_CMD_DONE, b'')
                     bl_done = True
 
+            self.statusBar().clearMessage()
+
             if( bl_failed == False ):
                 self.addMessage("Upload complete!")
                 endTime = time.time()